@@ -11,7 +11,7 @@ if __name__ == "__main__":
 
     for idx in range(5):
         cmap = generator.generate_colormap(name=f"colormap_{idx}")
-        swatch = generator.create_swatch(cmap)
+        swatch = generator.create_compact_swatch(cmap)
         axes[idx].imshow(swatch, aspect='auto')
         axes[idx].axis('off')
         axes[idx].set_title(f"Colormap {idx}", loc='left')
@@ -22,7 +22,7 @@ if __name__ == "__main__":
     # Generate colormap swatch
     fig, ax = plt.subplots(1, 1, figsize=(10, 1.5))
 
-    swatch = generator.create_swatch(cmap)
+    swatch = generator.create_compact_swatch(cmap)
     ax.imshow(swatch, aspect='auto')
     ax.axis('off')
     ax.set_title(f"Colormap 'Ocean Waves'", loc='left')
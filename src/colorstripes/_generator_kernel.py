@@ -0,0 +1,138 @@
+"""
+Array kernels used by the colormap generator.
+
+Everything here operates on plain NumPy arrays; the random parameters are
+drawn by ``ColormapGenerator`` and passed in, so these functions are
+deterministic.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+# Per-component stripe parameters:
+# (freqs, phases, amp_starts, amp_ends, fmod_freqs, use_tanh)
+StripeParams = Tuple[
+    np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray
+]
+
+# For each hue sector, the indices into the (v, t, p, q) source channels
+# that make up the (r, g, b) output
+_HSV_SECTOR_LUT = np.array([
+    [0, 1, 2],
+    [3, 0, 2],
+    [2, 0, 1],
+    [2, 3, 0],
+    [1, 2, 0],
+    [0, 2, 3],
+])
+
+
+def hsv_to_rgb(h: np.ndarray, s: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """
+    Convert 1-D HSV arrays to an (n, 3) RGB array using the piecewise
+    sector formula, without any Python-level branching.
+
+    Inputs must already lie in [0, 1]; unlike
+    ``matplotlib.colors.hsv_to_rgb`` they are not range-checked, and
+    out-of-range hues produce meaningless colors.
+    """
+    h6 = 6.0 * h
+    sector = h6.astype(np.intp) % 6
+    f = h6 - np.floor(h6)
+    p = v * (1 - s)
+    q = v * (1 - s * f)
+    t = v * (1 - s * (1 - f))
+
+    sources = np.stack([v, t, p, q], axis=1)
+    return np.take_along_axis(sources, _HSV_SECTOR_LUT[sector], axis=1)
+
+
+def stripe_components(
+    x: np.ndarray,
+    two_pi_x: np.ndarray,
+    freqs: np.ndarray,
+    phases: np.ndarray,
+    amp_starts: np.ndarray,
+    amp_ends: np.ndarray,
+    fmod_freqs: np.ndarray,
+    use_tanh: np.ndarray
+) -> np.ndarray:
+    """
+    Evaluate all stripe components at once.
+
+    Each parameter array holds one entry per component, so the whole
+    stripe pattern is computed with a single (n_components, n_points)
+    pass per operation rather than one pass per component. Returns the
+    unsummed components, one row each.
+    """
+    # The whole chain runs through two reused (n_components, n_points)
+    # buffers, built on the shared 2*pi*x grid with in-place ufuncs
+
+    # Frequency modulation for varying stripe width:
+    # 1 + 0.3 * sin(fmod_freq * 2*pi*x)
+    freq_mod = np.multiply(fmod_freqs[:, None], two_pi_x)
+    np.sin(freq_mod, out=freq_mod)
+    freq_mod *= 0.3
+    freq_mod += 1
+
+    # sin(freq * freq_mod * 2*pi*x + phase)
+    components: np.ndarray = np.multiply(freqs[:, None], two_pi_x)
+    components *= freq_mod
+    components += phases[:, None]
+    np.sin(components, out=components)
+
+    # Amplitude ramps linearly from amp_start to amp_end across the
+    # colormap; reuse the frequency modulation buffer to hold it
+    amplitude = np.multiply((amp_ends - amp_starts)[:, None], x, out=freq_mod)
+    amplitude += amp_starts[:, None]
+    components *= amplitude
+
+    # Square-ish waves for sharper stripes on the selected components
+    components[use_tanh] = amplitude[use_tanh] * np.tanh(5 * components[use_tanh])
+
+    return components
+
+
+def generate_rgb(
+    x: np.ndarray,
+    two_pi_x: np.ndarray,
+    hue: np.ndarray,
+    sat: np.ndarray,
+    val: np.ndarray,
+    hue_stripe_params: StripeParams,
+    val_stripe_params: StripeParams
+) -> np.ndarray:
+    """
+    Apply hue/value stripes and saturation variation to the base HSV
+    channels and convert the result to an (n_points, 3) RGB array.
+
+    The hue and value stripe sets are evaluated together as one stacked
+    block of components, then reduced back to one row per set. The
+    ``hue``, ``sat`` and ``val`` arrays are updated in place.
+    """
+    params = [
+        np.concatenate([h, v])
+        for h, v in zip(hue_stripe_params, val_stripe_params)
+    ]
+    components = stripe_components(x, two_pi_x, *params)
+    hue_stripes, val_stripes = np.add.reduceat(
+        components, [0, len(hue_stripe_params[0])], axis=0
+    )
+
+    # Apply stripes, wrapping hue into [0, 1) as hue - floor(hue)
+    np.add(hue, hue_stripes, out=hue)
+    np.subtract(hue, np.floor(hue, out=hue_stripes), out=hue)
+    np.add(val, val_stripes, out=val)
+    np.maximum(val, 0.0, out=val)
+    np.minimum(val, 1.0, out=val)
+
+    # Add subtle saturation variation
+    sat_variation = np.sin(10 * two_pi_x)
+    sat_variation *= 0.05
+    np.add(sat, sat_variation, out=sat)
+    np.maximum(sat, 0.0, out=sat)
+    np.minimum(sat, 1.0, out=sat)
+
+    return hsv_to_rgb(hue, sat, val)
@@ -5,7 +5,6 @@ Command-line interface for ColorStripes.
 from typing import Optional, Literal
 
 import click
-import matplotlib.pyplot as plt
 
 from .generator import ColormapGenerator
 from .utils import save_colormap
@@ -69,30 +68,32 @@ def main(
     # Generate colormap
     cmap = generator.generate_colormap(name, **params)
     
-    # Create and display swatch
-    swatch = generator.create_swatch(cmap, width=800, height=60)
+    # Save colormap
+    if output:
+        save_colormap(cmap, output, format)
     
-    if show:
+    # Only build the swatch (and load pyplot) if it will be saved or shown
+    save_swatch = bool(output) and format in ['png', 'both']
+    
+    if show or save_swatch:
+        import matplotlib.pyplot as plt
+        
+        swatch = generator.create_swatch(cmap, width=800, height=60)
+        
         plt.figure(figsize=(10, 2))
         plt.imshow(swatch, aspect='auto')
         plt.title(name, loc='left', fontsize=16)
         plt.axis('off')
         plt.tight_layout()
-        plt.show()
-    
-    # Save colormap
-    if output:
-        save_colormap(cmap, output, format)
         
-        # Save swatch image
-        if format in ['png', 'both']:
-            plt.figure(figsize=(10, 2))
-            plt.imshow(swatch, aspect='auto')
-            plt.title(name, loc='left', fontsize=16)
-            plt.axis('off')
-            plt.tight_layout()
+        # Save swatch image before showing, as show() may close the figure
+        if save_swatch:
             plt.savefig(f"{output}_swatch.png", dpi=150, bbox_inches='tight')
             click.echo(f"Saved swatch to {output}_swatch.png")
+        
+        # Display swatch
+        if show:
+            plt.show()
 
 
 if __name__ == '__main__':
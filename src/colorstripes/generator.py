@@ -2,11 +2,21 @@
 Core colormap generation functionality.
 """
 
+import math
+import random
+
 import numpy as np
-import matplotlib.colors as mcolors
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.colors import Colormap, ListedColormap
 from typing import Tuple, Optional, Dict, Any
 
+from ._generator_kernel import (
+    StripeParams,
+    generate_rgb,
+    hsv_to_rgb,
+    stripe_components,
+)
+from .utils import _sample_cmap
+
 
 class ColormapGenerator:
     """Generate complex colormaps with background transitions and stripe patterns."""
@@ -23,8 +33,29 @@ class ColormapGenerator:
             Random seed for reproducibility
         """
         self.n_points = n_points
-        if seed is not None:
-            np.random.seed(seed)
+        
+        # Cached sample grid, kept in step with n_points by _update_grid
+        self._x: np.ndarray = np.empty(0, dtype=np.float32)
+        self._two_pi_x: np.ndarray = self._x
+        self._update_grid()
+        
+        # Per-instance random sources: a NumPy Generator for array draws
+        # and a Python Random for cheap scalar draws
+        self.rng = np.random.default_rng(seed)
+        self._py_rng = random.Random(seed)
+    
+    def _update_grid(self) -> None:
+        """
+        Build the sample grid shared by every generation call, rebuilding
+        it if ``n_points`` has been changed since it was last built.
+        """
+        if len(self._x) == self.n_points:
+            return
+        
+        # Colors only need single precision, so the whole pipeline runs
+        # in float32
+        self._x = np.linspace(0.0, 1.0, self.n_points, dtype=np.float32)
+        self._two_pi_x = np.float32(2 * np.pi) * self._x
     
     def generate_smooth_base(
         self,
@@ -50,32 +81,38 @@ class ColormapGenerator:
         Returns:
         --------
         tuple
-            Arrays of hue, saturation, and value components
+            float32 arrays of hue, saturation, and value components
         """
-        # Generate control points
-        x_control = np.linspace(0, 1, n_control_points)
+        self._update_grid()
         
         # Generate smooth transitions for HSV components
-        hue_control = np.random.uniform(*hue_range, n_control_points)
-        sat_control = np.random.uniform(*saturation_range, n_control_points)
-        val_control = np.random.uniform(*value_range, n_control_points)
+        hue_control = self.rng.uniform(*hue_range, n_control_points)
+        sat_control = self.rng.uniform(*saturation_range, n_control_points)
+        val_control = self.rng.uniform(*value_range, n_control_points)
         
         # Add some structure to hue transitions
-        hue_control = np.cumsum(np.random.uniform(-0.3, 0.3, n_control_points))
+        hue_control = np.cumsum(self.rng.uniform(-0.3, 0.3, n_control_points))
         hue_control = (hue_control - hue_control.min()) / (hue_control.max() - hue_control.min() + 1e-8)
         hue_control = hue_control * (hue_range[1] - hue_range[0]) + hue_range[0]
         
-        # Interpolate to full resolution
-        x = np.linspace(0, 1, self.n_points)
-        hue = np.interp(x, x_control, hue_control)
-        sat = np.interp(x, x_control, sat_control)
-        val = np.interp(x, x_control, val_control)
+        # Interpolate to full resolution. The control points are evenly
+        # spaced, so the bin index and fractional offset can be computed
+        # directly once and shared by all three channels.
+        t = self._x * (n_control_points - 1)
+        idx = np.clip(t.astype(np.intp), 0, n_control_points - 2)
+        frac = np.subtract(t, idx, dtype=np.float32)[:, None]
+        
+        control = np.stack(
+            [hue_control, sat_control, val_control], axis=1
+        ).astype(np.float32)
+        interp = control[idx] + (control[idx + 1] - control[idx]) * frac
+        hue, sat, val = interp[:, 0], interp[:, 1], interp[:, 2]
         
         # Add varying rate of change using sine waves
-        freq = np.random.uniform(1, 4)
-        phase = np.random.uniform(0, 2*np.pi)
-        amplitude = np.random.uniform(0.05, 0.15)
-        hue += amplitude * np.sin(freq * 2 * np.pi * x + phase)
+        freq = self._py_rng.uniform(1, 4)
+        phase = self._py_rng.uniform(0, 2*math.pi)
+        amplitude = self._py_rng.uniform(0.05, 0.15)
+        hue += amplitude * np.sin(freq * self._two_pi_x + phase)
         
         # Ensure hue wraps correctly
         # For restricted hue ranges, clip instead of wrap to maintain range
@@ -107,44 +144,65 @@ class ColormapGenerator:
         Returns:
         --------
         np.ndarray
-            Array of stripe values
+            float32 array of stripe values
         """
-        x = np.linspace(0, 1, self.n_points)
-        stripes = np.zeros_like(x)
+        self._update_grid()
+        params = self._draw_stripe_params(
+            base_frequency, frequency_variation, amplitude_range
+        )
         
-        # Generate multiple stripe components
-        n_components = np.random.randint(3, 7)
-        
-        for i in range(n_components):
-            # Varying frequency
-            freq = base_frequency * np.random.uniform(
-                1 - frequency_variation, 
-                1 + frequency_variation
-            )
-            
-            # Varying phase
-            phase = np.random.uniform(0, 2*np.pi)
-            
-            # Varying amplitude that changes across the colormap
-            amp_start = np.random.uniform(*amplitude_range)
-            amp_end = np.random.uniform(*amplitude_range)
-            amplitude = np.linspace(amp_start, amp_end, self.n_points)
-            
-            # Add frequency modulation for varying stripe width
-            freq_mod = 1 + 0.3 * np.sin(2 * np.pi * x * np.random.uniform(0.5, 2))
-            
-            # Generate stripe component
-            stripe_component = amplitude * np.sin(2 * np.pi * freq * freq_mod * x + phase)
-            
-            # Randomly use different waveforms for variety
-            if np.random.random() > 0.5:
-                # Square-ish waves for sharper stripes
-                stripe_component = amplitude * np.tanh(5 * stripe_component)
-            
-            stripes += stripe_component
+        stripes: np.ndarray = stripe_components(
+            self._x, self._two_pi_x, *params
+        ).sum(axis=0)
         
         return stripes
     
+    def _draw_stripe_params(
+        self,
+        base_frequency: float,
+        frequency_variation: float,
+        amplitude_range: Tuple[float, float]
+    ) -> StripeParams:
+        """
+        Draw the random per-component parameters for one stripe pattern.
+        """
+        # Generate multiple stripe components
+        n_components = int(self.rng.integers(3, 7))
+        
+        # Draw each parameter for all components in a single batched call,
+        # directly in float32
+        
+        # Varying frequency
+        freqs = base_frequency * self._uniform32(
+            1 - frequency_variation,
+            1 + frequency_variation,
+            n_components
+        )
+        
+        # Varying phase
+        phases = self._uniform32(0, 2*math.pi, n_components)
+        
+        # Varying amplitude that changes across the colormap
+        amp_starts = self._uniform32(*amplitude_range, n_components)
+        amp_ends = self._uniform32(*amplitude_range, n_components)
+        
+        # Frequency modulation for varying stripe width
+        fmod_freqs = self._uniform32(0.5, 2, n_components)
+        
+        # Randomly use different waveforms for variety
+        use_tanh = self.rng.random(n_components, dtype=np.float32) > 0.5
+        
+        return freqs, phases, amp_starts, amp_ends, fmod_freqs, use_tanh
+    
+    def _uniform32(self, low: float, high: float, size: int) -> np.ndarray:
+        """
+        Draw ``size`` float32 samples uniformly from [low, high).
+        """
+        draws = self.rng.random(size, dtype=np.float32)
+        draws *= high - low
+        draws += low
+        return draws
+    
     def hsv_to_rgb(
         self,
         h: np.ndarray,
@@ -166,26 +224,35 @@ class ColormapGenerator:
         Returns:
         --------
         np.ndarray
-            RGB values array of shape (n_points, 3)
+            float32 RGB values array of shape (n_points, 3)
+        
+        Raises:
+        -------
+        ValueError
+            If any HSV value lies outside 0-1
         """
-        # Stack HSV channels
-        hsv = np.stack([h, s, v], axis=-1)
+        hsv = [np.asarray(c, dtype=np.float32) for c in (h, s, v)]
         
-        # Convert to RGB
-        rgb = np.zeros_like(hsv)
-        for i in range(len(h)):
-            rgb[i] = mcolors.hsv_to_rgb([hsv[i, 0], hsv[i, 1], hsv[i, 2]])
+        # The sector kernel does not range-check, so match the ValueError
+        # raised by matplotlib.colors.hsv_to_rgb here
+        if any(np.any((c < 0) | (c > 1)) for c in hsv):
+            raise ValueError("HSV values must be between 0 and 1")
         
-        return rgb
+        return hsv_to_rgb(*hsv)
     
     def generate_colormap(
         self,
         name: str = "custom",
         **kwargs: Any
-    ) -> LinearSegmentedColormap:
+    ) -> ListedColormap:
         """
         Generate a complete colormap.
         
+        The stripes and HSV to RGB conversion are evaluated together by a
+        fused kernel rather than through ``generate_stripes`` and
+        ``hsv_to_rgb``, so overriding those methods in a subclass does not
+        change the output of this method.
+        
         Parameters:
         -----------
         name : str
@@ -203,9 +270,11 @@ class ColormapGenerator:
         
         Returns:
         --------
-        LinearSegmentedColormap
+        ListedColormap
             The generated colormap
         """
+        self._update_grid()
+        
         # Generate base colors
         hue, sat, val = self.generate_smooth_base(
             n_control_points=kwargs.get('n_control_points', 5),
@@ -214,38 +283,34 @@ class ColormapGenerator:
             value_range=kwargs.get('value_range', (0.4, 0.95))
         )
         
-        # Generate stripes
-        hue_stripes = self.generate_stripes(
+        # Draw stripe parameters
+        hue_stripe_params = self._draw_stripe_params(
             base_frequency=kwargs.get('stripe_frequency', 50),
             frequency_variation=kwargs.get('frequency_variation', 0.5),
             amplitude_range=kwargs.get('hue_stripe_amplitude', (0.02, 0.08))
         )
         
-        val_stripes = self.generate_stripes(
+        val_stripe_params = self._draw_stripe_params(
             base_frequency=kwargs.get('stripe_frequency', 50) * 1.5,
             frequency_variation=kwargs.get('frequency_variation', 0.3),
             amplitude_range=kwargs.get('val_stripe_amplitude', (0.05, 0.15))
         )
         
-        # Apply stripes
-        hue = (hue + hue_stripes) % 1.0
-        val = np.clip(val + val_stripes, 0, 1)
-        
-        # Add subtle saturation variation
-        sat_variation = 0.05 * np.sin(20 * np.pi * np.linspace(0, 1, self.n_points))
-        sat = np.clip(sat + sat_variation, 0, 1)
-        
-        # Convert to RGB
-        rgb = self.hsv_to_rgb(hue, sat, val)
+        # Apply stripes and convert to RGB in one fused pipeline
+        rgb = generate_rgb(
+            self._x, self._two_pi_x, hue, sat, val,
+            hue_stripe_params, val_stripe_params
+        )
         
-        # Create colormap
-        cmap = LinearSegmentedColormap.from_list(name, rgb, N=self.n_points)
+        # Create colormap. The RGB samples already form the lookup table,
+        # so use them directly instead of re-interpolating segment data.
+        cmap = ListedColormap(rgb, name=name)
         
         return cmap
     
     def create_swatch(
         self,
-        cmap: LinearSegmentedColormap,
+        cmap: Colormap,
         width: int = 800,
         height: int = 60
     ) -> np.ndarray:
@@ -264,9 +329,38 @@ class ColormapGenerator:
         Returns:
         --------
         numpy.ndarray
-            The swatch image of shape (height, width, 4)
+            The swatch image of shape (height, width, 4). This is a
+            read-only view repeating a single row; call ``.copy()`` if a
+            writable array is needed.
         """
-        gradient = np.linspace(0, 1, width).reshape(1, -1)
-        gradient = np.repeat(gradient, height, axis=0)
+        # Every row is identical, so evaluate the colormap once and
+        # broadcast it rather than materializing height copies
+        row = _sample_cmap(cmap, width)
         
-        return cmap(gradient)
\ No newline at end of file
+        return np.broadcast_to(row[None, :, :], (height, width, 4))
+    
+    def create_compact_swatch(
+        self,
+        cmap: Colormap,
+        width: int = 256
+    ) -> np.ndarray:
+        """
+        Create a single-row swatch of the colormap.
+        
+        Useful for ``imshow`` with ``aspect='auto'``, which stretches the
+        row to fill the axes anyway, so there is no need to build a full
+        height swatch.
+        
+        Parameters:
+        -----------
+        cmap : matplotlib colormap
+            The colormap to visualize
+        width : int
+            Number of samples along the colormap
+        
+        Returns:
+        --------
+        numpy.ndarray
+            The swatch image of shape (1, width, 4)
+        """
+        return self.create_swatch(cmap, width=width, height=1)
@@ -3,61 +3,112 @@ Utility functions for colormap handling and export.
 """
 
 import json
-from typing import Literal, Union
+from typing import TYPE_CHECKING, Literal, Union
 
-from matplotlib.colors import LinearSegmentedColormap
-import matplotlib.pyplot as plt
 import numpy as np
 
+if TYPE_CHECKING:
+    from matplotlib.colors import Colormap, LinearSegmentedColormap
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _sample_cmap(cmap: "Colormap", width: int) -> np.ndarray:
+    """
+    Sample a colormap at ``width`` evenly spaced points in [0, 1].
+    
+    Equivalent to ``cmap(np.linspace(0, 1, width))``, but indexes the
+    colormap's lookup table directly, skipping the normalization,
+    masking and alpha handling of ``Colormap.__call__``.
+    """
+    # The lookup table is private matplotlib API, built lazily on first use
+    if not cmap._isinit:  # type: ignore[attr-defined]
+        cmap._init()  # type: ignore[attr-defined]
+    lut: np.ndarray = cmap._lut  # type: ignore[attr-defined]
+    
+    # Same index mapping as Colormap.__call__: floor(x * N), with x == 1
+    # mapped onto the last entry
+    idx = (np.linspace(0, 1, width) * cmap.N).astype(np.intp)
+    np.minimum(idx, cmap.N - 1, out=idx)
+    
+    samples: np.ndarray = lut.take(idx, axis=0)
+    return samples
+
 
 def save_colormap(
-    cmap: LinearSegmentedColormap,
+    cmap: "Colormap",
     output_path: str,
-    format: Union[Literal["json"], Literal["png"], Literal["both"]] = "both"
+    format: Union[Literal["json"], Literal["png"], Literal["both"]] = "both",
+    precision: Union[Literal["float"], Literal["uint8"]] = "uint8"
 ) -> None:
     """
     Save colormap in specified format(s).
     
     Parameters:
     -----------
-    cmap : LinearSegmentedColormap
+    cmap : matplotlib colormap
         The colormap to save
     output_path : str
         Base output path (without extension)
     format : str
         Output format: 'json', 'png', or 'both'
+    precision : str
+        Encoding of the JSON colors: 'uint8' stores 8-bit integers (0-255),
+        'float' stores full-precision floats (0-1)
+    
+    Raises:
+    -------
+    ValueError
+        If precision is not 'uint8' or 'float'
     """
+    if precision not in ["uint8", "float"]:
+        raise ValueError(
+            f"precision must be 'uint8' or 'float', got {precision!r}"
+        )
+    
     if format in ["json", "both"]:
-        # Save as JSON (RGB values)
-        colors = cmap(np.linspace(0, 1, 256))[:, :3]  # Remove alpha channel
+        # Save as JSON (RGB values, alpha channel removed)
+        colors = _sample_cmap(cmap, 256)[:, :3]
+        if precision == "uint8":
+            colors = (colors * 255 + 0.5).astype(np.uint8)
+        else:
+            colors = np.ascontiguousarray(colors)
         cmap_data = {
             "name": cmap.name,
-            "colors": colors.tolist(),
-            "n_colors": len(colors)
+            "colors": colors,
+            "n_colors": len(colors),
+            "encoding": precision
         }
         
+        # Serialize compactly in one go; orjson handles the array natively
+        if orjson is not None:
+            payload = orjson.dumps(cmap_data, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            cmap_data["colors"] = colors.tolist()
+            payload = json.dumps(cmap_data, separators=(",", ":")).encode()
+        
         json_path = f"{output_path}.json"
-        with open(json_path, "w") as f:
-            json.dump(cmap_data, f, indent=2)
+        with open(json_path, "wb") as f:
+            f.write(payload)
         print(f"Saved colormap data to {json_path}")
     
     if format in ["png", "both"]:
-        # Save as gradient image
-        gradient = np.linspace(0, 1, 1000).reshape(1, -1)
-        gradient = np.repeat(gradient, 100, axis=0)
+        from PIL import Image
         
-        plt.figure(figsize=(10, 1))
-        plt.imshow(gradient, cmap=cmap, aspect='auto')
-        plt.axis('off')
-        plt.tight_layout()
+        # Save as a 1000x100 gradient image, encoded directly rather
+        # than rendered through a matplotlib figure
+        row = (_sample_cmap(cmap, 1000)[:, :3] * 255 + 0.5).astype(np.uint8)
+        gradient = np.broadcast_to(row[None, :, :], (100, 1000, 3))
         
         png_path = f"{output_path}.png"
-        plt.savefig(png_path, dpi=150, bbox_inches='tight', pad_inches=0)
-        plt.close()
+        Image.fromarray(np.ascontiguousarray(gradient)).save(png_path)
         print(f"Saved colormap gradient to {png_path}")
 
 
-def load_colormap_from_json(json_path: str) -> LinearSegmentedColormap:
+def load_colormap_from_json(json_path: str) -> "LinearSegmentedColormap":
     """
     Load a colormap from a JSON file.
     
@@ -71,10 +122,15 @@ def load_colormap_from_json(json_path: str) -> LinearSegmentedColormap:
     LinearSegmentedColormap
         The loaded colormap
     """
+    from matplotlib.colors import LinearSegmentedColormap
+    
     with open(json_path, 'r') as f:
         data = json.load(f)
     
-    colors = np.array(data['colors'])
+    if data.get('encoding') == 'uint8':
+        colors = np.asarray(data['colors'], dtype=float) / 255
+    else:
+        colors = np.array(data['colors'])
     name = data.get('name', 'custom')
     
     return LinearSegmentedColormap.from_list(name, colors)
\ No newline at end of file
@@ -7,6 +7,7 @@ from click.testing import CliRunner
 from pathlib import Path
 import json
 
+from colorstripes import ColormapGenerator
 from colorstripes.cli import main
 
 
@@ -57,6 +58,26 @@ class TestCLI:
         assert 'colors' in data
         assert data['n_colors'] == 256
     
+    def test_save_json_skips_swatch(self, runner, tmp_path, monkeypatch):
+        """Test JSON-only output without display never builds a swatch."""
+        def fail_create_swatch(*args, **kwargs):
+            raise AssertionError("create_swatch should not be called")
+        
+        monkeypatch.setattr(
+            ColormapGenerator, "create_swatch", fail_create_swatch
+        )
+        output_path = tmp_path / "test_output"
+        
+        result = runner.invoke(main, [
+            '--output', str(output_path),
+            '--format', 'json',
+            '--no-show'
+        ])
+        
+        assert result.exit_code == 0
+        assert output_path.with_suffix('.json').exists()
+        assert not (output_path.parent / f"{output_path.name}_swatch.png").exists()
+    
     def test_save_png(self, runner, tmp_path):
         """Test saving as PNG."""
         output_path = tmp_path / "test_output"
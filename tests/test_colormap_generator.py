@@ -0,0 +1,83 @@
+"""
+Tests for the ColormapGenerator public methods.
+"""
+
+import numpy as np
+import pytest
+
+from colorstripes import ColormapGenerator
+
+
+class TestColormapGenerator:
+    """Test ColormapGenerator methods."""
+    
+    @pytest.fixture
+    def generator(self):
+        """Create a seeded generator."""
+        return ColormapGenerator(seed=42)
+    
+    def test_generate_stripes(self, generator):
+        """Test stripes are one float32 value per point, within amplitude."""
+        amplitude_range = (0.05, 0.2)
+        
+        stripes = generator.generate_stripes(amplitude_range=amplitude_range)
+        
+        assert stripes.shape == (generator.n_points,)
+        assert stripes.dtype == np.float32
+        # At most 6 components, each bounded by its amplitude
+        assert np.all(np.abs(stripes) <= 6 * amplitude_range[1] + 1e-6)
+        assert np.any(stripes != 0)
+    
+    def test_generate_stripes_reproducible(self):
+        """Test the same seed produces the same stripes."""
+        first = ColormapGenerator(seed=7).generate_stripes()
+        second = ColormapGenerator(seed=7).generate_stripes()
+        other = ColormapGenerator(seed=8).generate_stripes()
+        
+        np.testing.assert_array_equal(first, second)
+        assert not np.array_equal(first, other)
+    
+    def test_changed_n_points_is_honored(self, generator):
+        """Test changing n_points after construction resizes the output."""
+        generator.n_points = 100
+        
+        cmap = generator.generate_colormap()
+        
+        assert cmap.N == 100
+        assert generator.generate_stripes().shape == (100,)
+        assert all(c.shape == (100,) for c in generator.generate_smooth_base())
+    
+    def test_hsv_to_rgb_shape(self, generator):
+        """Test hsv_to_rgb returns one RGB row per sample."""
+        h = np.linspace(0, 1, 10)
+        rgb = generator.hsv_to_rgb(h, np.full(10, 0.5), np.full(10, 0.8))
+        
+        assert rgb.shape == (10, 3)
+    
+    @pytest.mark.parametrize("channel", [0, 1, 2])
+    @pytest.mark.parametrize("bad_value", [-0.1, 1.1])
+    def test_hsv_to_rgb_out_of_range(self, generator, channel, bad_value):
+        """Test out-of-range HSV input is rejected, as matplotlib does."""
+        hsv = [np.full(4, 0.5) for _ in range(3)]
+        hsv[channel][2] = bad_value
+        
+        with pytest.raises(ValueError):
+            generator.hsv_to_rgb(*hsv)
+    
+    def test_create_compact_swatch_default_width(self, generator):
+        """Test the compact swatch is a single 256-sample row by default."""
+        cmap = generator.generate_colormap()
+        
+        swatch = generator.create_compact_swatch(cmap)
+        
+        assert swatch.shape == (1, 256, 4)
+    
+    @pytest.mark.parametrize("width", [1, 64, 800])
+    def test_create_compact_swatch_values(self, generator, width):
+        """Test the compact swatch samples the colormap evenly."""
+        cmap = generator.generate_colormap()
+        
+        swatch = generator.create_compact_swatch(cmap, width=width)
+        
+        assert swatch.shape == (1, width, 4)
+        np.testing.assert_array_equal(swatch[0], cmap(np.linspace(0, 1, width)))
@@ -0,0 +1,126 @@
+"""
+Tests for the array kernels behind the colormap generator.
+"""
+
+import matplotlib.colors as mcolors
+import numpy as np
+import pytest
+
+from colorstripes._generator_kernel import (
+    generate_rgb,
+    hsv_to_rgb,
+    stripe_components,
+)
+
+
+def _random_stripe_params(rng, n_components, tanh_pattern):
+    """Draw float32 stripe parameters like ColormapGenerator does."""
+    return (
+        rng.uniform(25, 75, n_components).astype(np.float32),
+        rng.uniform(0, 2 * np.pi, n_components).astype(np.float32),
+        rng.uniform(0.02, 0.15, n_components).astype(np.float32),
+        rng.uniform(0.02, 0.15, n_components).astype(np.float32),
+        rng.uniform(0.5, 2, n_components).astype(np.float32),
+        np.array(tanh_pattern, dtype=bool),
+    )
+
+
+def _reference_components(x, params):
+    """Per-component float64 loop, as generate_stripes originally did it."""
+    x = x.astype(np.float64)
+    freqs, phases, amp_starts, amp_ends, fmod_freqs, use_tanh = params
+    components = []
+    for k in range(len(freqs)):
+        amplitude = np.linspace(amp_starts[k], amp_ends[k], len(x))
+        freq_mod = 1 + 0.3 * np.sin(2 * np.pi * x * fmod_freqs[k])
+        component = amplitude * np.sin(
+            2 * np.pi * freqs[k] * freq_mod * x + phases[k]
+        )
+        if use_tanh[k]:
+            component = amplitude * np.tanh(5 * component)
+        components.append(component)
+    return np.array(components)
+
+
+class TestHsvToRgb:
+    """Test the sector-based HSV to RGB kernel."""
+    
+    @pytest.fixture
+    def hsv(self):
+        """Random HSV samples plus the h=0, h=1, s=0 and v=0 edges."""
+        rng = np.random.default_rng(0)
+        h, s, v = rng.random((3, 1000))
+        h[:4] = [0.0, 1.0, 0.0, 1.0]
+        h[4:10] = np.arange(6) / 6  # sector boundaries
+        s[10:20] = 0.0
+        v[20:30] = 0.0
+        return h, s, v
+    
+    def test_matches_matplotlib_float64(self, hsv):
+        """Test float64 output is identical to matplotlib's conversion."""
+        h, s, v = hsv
+        expected = mcolors.hsv_to_rgb(np.stack([h, s, v], -1))
+        
+        np.testing.assert_array_equal(hsv_to_rgb(h, s, v), expected)
+    
+    def test_matches_matplotlib_float32(self, hsv):
+        """Test float32 output matches matplotlib to single precision."""
+        h, s, v = (c.astype(np.float32) for c in hsv)
+        expected = mcolors.hsv_to_rgb(np.stack([h, s, v], -1))
+        
+        rgb = hsv_to_rgb(h, s, v)
+        
+        assert rgb.dtype == np.float32
+        np.testing.assert_allclose(rgb, expected, rtol=0, atol=1e-6)
+
+
+class TestStripeKernels:
+    """Test the fused stripe and colormap assembly kernels."""
+    
+    # float32 evaluation against the float64 reference differs by ~1.5e-5
+    ATOL = 1e-4
+    
+    @pytest.fixture
+    def grid(self):
+        """The float32 sample grid used by ColormapGenerator."""
+        x = np.linspace(0.0, 1.0, 256, dtype=np.float32)
+        return x, np.float32(2 * np.pi) * x
+    
+    def test_stripe_components_match_reference(self, grid):
+        """Test the batched components match a per-component loop."""
+        x, two_pi_x = grid
+        params = _random_stripe_params(
+            np.random.default_rng(1), 5, [True, False, True, False, False]
+        )
+        
+        components = stripe_components(x, two_pi_x, *params)
+        
+        assert components.shape == (5, 256)
+        np.testing.assert_allclose(
+            components, _reference_components(x, params), rtol=0, atol=self.ATOL
+        )
+    
+    def test_generate_rgb_splits_hue_and_value_stripes(self, grid):
+        """Test the stacked components are reduced back to the right set."""
+        x, two_pi_x = grid
+        rng = np.random.default_rng(2)
+        
+        # Different component counts, so a wrong split point would show
+        hue_params = _random_stripe_params(rng, 3, [False, True, False])
+        val_params = _random_stripe_params(rng, 5, [True, True, False, False, True])
+        hue, sat, val = rng.uniform(0.2, 0.8, (3, 256)).astype(np.float32)
+        
+        # Reference: apply each stripe set separately in float64
+        hue_stripes = _reference_components(x, hue_params).sum(axis=0)
+        val_stripes = _reference_components(x, val_params).sum(axis=0)
+        sat_variation = 0.05 * np.sin(20 * np.pi * x.astype(np.float64))
+        expected = mcolors.hsv_to_rgb(np.stack([
+            (hue + hue_stripes) % 1.0,
+            np.clip(sat + sat_variation, 0, 1),
+            np.clip(val + val_stripes, 0, 1),
+        ], -1))
+        
+        rgb = generate_rgb(x, two_pi_x, hue, sat, val, hue_params, val_params)
+        
+        assert rgb.shape == (256, 3)
+        np.testing.assert_allclose(rgb, expected, rtol=0, atol=self.ATOL)
@@ -6,12 +6,13 @@ import json
 from pathlib import Path
 import tempfile
 
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.colors import LinearSegmentedColormap, ListedColormap
 import numpy as np
 import pytest
 
+import colorstripes.utils
 from colorstripes import ColormapGenerator
-from colorstripes.utils import save_colormap, load_colormap_from_json
+from colorstripes.utils import _sample_cmap, save_colormap, load_colormap_from_json
 
 
 class TestUtils:
@@ -41,6 +42,28 @@ class TestUtils:
         assert len(data["colors"]) == 256
         assert data["n_colors"] == 256
         
+        # Verify color format (8-bit by default)
+        assert data["encoding"] == "uint8"
+        assert all(len(color) == 3 for color in data["colors"])
+        assert all(
+            all(isinstance(c, int) and 0 <= c <= 255 for c in color)
+            for color in data["colors"]
+        )
+    
+    def test_save_colormap_json_float(self, sample_colormap, tmp_path):
+        """Test saving colormap as JSON with full-precision floats."""
+        output_path = tmp_path / "test_cmap"
+        
+        save_colormap(
+            sample_colormap, str(output_path), format="json", precision="float"
+        )
+        
+        with open(output_path.with_suffix(".json"), 'r') as f:
+            data = json.load(f)
+        
+        assert data["encoding"] == "float"
+        assert len(data["colors"]) == 256
+        
         # Verify color format
         assert all(len(color) == 3 for color in data["colors"])
         assert all(
@@ -48,6 +71,35 @@ class TestUtils:
             for color in data["colors"]
         )
     
+    @pytest.mark.parametrize("backend", ["orjson", "json"])
+    @pytest.mark.parametrize("precision", ["uint8", "float"])
+    def test_save_colormap_json_backends(
+        self, sample_colormap, tmp_path, monkeypatch, backend, precision
+    ):
+        """Test the orjson and stdlib json serializers write the same data."""
+        if backend == "orjson":
+            monkeypatch.setattr(
+                colorstripes.utils, "orjson", pytest.importorskip("orjson")
+            )
+        else:
+            monkeypatch.setattr(colorstripes.utils, "orjson", None)
+        output_path = tmp_path / "test_cmap"
+        
+        save_colormap(
+            sample_colormap, str(output_path), format="json", precision=precision
+        )
+        
+        with open(output_path.with_suffix(".json"), 'r') as f:
+            data = json.load(f)
+        
+        expected = sample_colormap(np.linspace(0, 1, 256))[:, :3]
+        if precision == "uint8":
+            expected = (expected * 255 + 0.5).astype(np.uint8)
+        assert data["name"] == "test_colormap"
+        assert data["n_colors"] == 256
+        assert data["encoding"] == precision
+        np.testing.assert_array_equal(np.array(data["colors"]), expected)
+    
     def test_save_colormap_png(self, sample_colormap, tmp_path):
         """Test saving colormap as PNG."""
         output_path = tmp_path / "test_cmap"
@@ -76,7 +128,9 @@ class TestUtils:
         """Test loading colormap from JSON."""
         # First save a colormap
         output_path = tmp_path / "test_cmap"
-        save_colormap(sample_colormap, str(output_path), format="json")
+        save_colormap(
+            sample_colormap, str(output_path), format="json", precision="float"
+        )
         
         # Load it back
         json_file = output_path.with_suffix(".json")
@@ -95,6 +149,20 @@ class TestUtils:
             decimal=3
         )
     
+    def test_load_colormap_from_json_uint8(self, sample_colormap, tmp_path):
+        """Test loading an 8-bit encoded colormap rescales it to 0-1."""
+        output_path = tmp_path / "test_cmap"
+        save_colormap(sample_colormap, str(output_path), format="json")
+        
+        loaded_cmap = load_colormap_from_json(str(output_path.with_suffix(".json")))
+        
+        test_points = np.linspace(0, 1, 50)
+        np.testing.assert_allclose(
+            sample_colormap(test_points)[:, :3],
+            loaded_cmap(test_points)[:, :3],
+            atol=0.5 / 255 + 1e-9
+        )
+    
     def test_round_trip_consistency(self, tmp_path):
         """Test that saving and loading preserves colormap data."""
         # Generate colormap
@@ -103,7 +171,9 @@ class TestUtils:
         
         # Save and load
         output_path = tmp_path / "round_trip"
-        save_colormap(original_cmap, str(output_path), format="json")
+        save_colormap(
+            original_cmap, str(output_path), format="json", precision="float"
+        )
         loaded_cmap = load_colormap_from_json(str(output_path.with_suffix(".json")))
         
         # Compare at multiple points
@@ -129,6 +199,32 @@ class TestUtils:
         assert not output_path.with_suffix(".json").exists()
         assert not output_path.with_suffix(".png").exists()
     
+    def test_invalid_precision(self, sample_colormap, tmp_path):
+        """Test unknown JSON precision values are rejected."""
+        output_path = tmp_path / "test_cmap"
+        
+        with pytest.raises(ValueError, match="precision"):
+            save_colormap(
+                sample_colormap, str(output_path), format="json",
+                precision="float32"  # type: ignore
+            )
+        
+        assert not output_path.with_suffix(".json").exists()
+    
+    def test_load_named_colors(self, tmp_path):
+        """Test JSON listing matplotlib color names still loads."""
+        json_file = tmp_path / "named.json"
+        with open(json_file, 'w') as f:
+            json.dump({"name": "named", "colors": ["red", "#00ff00", "blue"]}, f)
+        
+        loaded_cmap = load_colormap_from_json(str(json_file))
+        
+        np.testing.assert_array_almost_equal(
+            loaded_cmap([0.0, 0.5, 1.0])[:, :3],
+            [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+            decimal=2
+        )
+    
     def test_load_invalid_json(self, tmp_path):
         """Test loading from invalid JSON file."""
         # Create invalid JSON
@@ -146,4 +242,16 @@ class TestUtils:
             json.dump({"name": "incomplete"}, f)
         
         with pytest.raises(KeyError):
-            load_colormap_from_json(str(json_file))
\ No newline at end of file
+            load_colormap_from_json(str(json_file))
+    
+    @pytest.mark.parametrize("width", [1, 2, 7, 256, 1000])
+    @pytest.mark.parametrize("cmap", [
+        ListedColormap(np.random.default_rng(0).random((37, 3)), name="listed"),
+        LinearSegmentedColormap.from_list("segmented", ["red", "green", "blue"]),
+    ])
+    def test_sample_cmap_matches_call(self, cmap, width):
+        """Test direct LUT sampling is identical to calling the colormap."""
+        np.testing.assert_array_equal(
+            _sample_cmap(cmap, width),
+            cmap(np.linspace(0, 1, width))
+        )